@@ -1,5 +1,10 @@
-﻿import threading
-from datetime import datetime
+﻿import asyncio
+import collections
+import concurrent.futures
+import os
+import queue
+import threading
+import time
 import json
 from pathlib import Path
 import sys
@@ -13,7 +18,22 @@ APP_TITLE = "Instagram Cleaner"
 SAVED_ACCOUNTS_FILE = Path("accounts.json")
 
 
+def _clean_account(value: str) -> str:
+    """Strip whitespace and one leading @ from an account name."""
+    value = value.strip()
+    return value[1:] if value.startswith("@") else value
+
+
 class InstagramCleanerApp:
+    _DETECTOR_COLORS = {
+        "SUCCESS": "#1f7a3f",
+        "WARNING": "#a85a00",
+        "ERROR": "#b42318",
+        "INFO": "#1f5faa",
+    }
+
+    _RENDER_CHUNK = 1000
+
     def __init__(self, root: tk.Tk) -> None:
         self.root = root
         self.root.title(APP_TITLE)
@@ -22,10 +42,29 @@ class InstagramCleanerApp:
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         self.service = InstagramService("session.json")
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_default_executor(
+            concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="ig-worker")
+        )
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
         self.non_followers: list[str] = []
+        self._render_limit = 0
+        self._list_extend_pending = False
+        self._last_fetch_from_cache = False
+        self._unfollow_stop = threading.Event()
+        self._action_buttons_enabled = False
         self.last_scan_counts = {"following": 0, "followers": 0}
 
+        self._log_queue: collections.deque[str] = collections.deque(maxlen=5000)
         self.saved_accounts = self._load_saved_accounts()
+        self._saved_index: dict[str, int] = {}
+        self._rebuild_saved_index()
+        self._accounts_version = 0
+        self._last_refreshed_version = -1
+        self._last_saved_blob: bytes | None = None
+        self._save_queue: queue.Queue[bytes | None] = queue.Queue(maxsize=1)
+        self._save_thread = threading.Thread(target=self._account_writer, daemon=True)
+        self._save_thread.start()
         self.username_var = tk.StringVar()
         self.saved_account_var = tk.StringVar(value=self.saved_accounts[0] if self.saved_accounts else "")
         self.delay_var = tk.StringVar(value="0.8")
@@ -38,8 +77,10 @@ class InstagramCleanerApp:
 
     def _apply_theme(self) -> None:
         style = ttk.Style()
-        if "clam" in style.theme_names():
+        try:
             style.theme_use("clam")
+        except tk.TclError:
+            pass
 
         self.root.configure(bg="#f3f6fb")
         style.configure("TFrame", background="#f3f6fb")
@@ -79,8 +120,7 @@ class InstagramCleanerApp:
         return Path(__file__).resolve().parent / relative_path
 
     def _load_saved_accounts(self) -> list[str]:
-        if not SAVED_ACCOUNTS_FILE.exists():
-            return []
+        # EAFP: read directly instead of paying a separate exists() stat.
         try:
             data = json.loads(SAVED_ACCOUNTS_FILE.read_text(encoding="utf-8"))
         except Exception:
@@ -92,7 +132,7 @@ class InstagramCleanerApp:
         for entry in data:
             if not isinstance(entry, str):
                 continue
-            username = entry.strip().lstrip("@")
+            username = _clean_account(entry)
             if not username:
                 continue
             lowered = username.lower()
@@ -103,17 +143,35 @@ class InstagramCleanerApp:
         return cleaned
 
     def _save_saved_accounts(self) -> None:
+        # Hand the write to the background writer so the Tk thread never
+        # blocks on disk (AV scanning can make the flush take 100+ ms).
+        blob = json.dumps(self.saved_accounts, ensure_ascii=False, indent=2).encode("utf-8")
+        if blob == self._last_saved_blob:
+            return
+        self._last_saved_blob = blob
         try:
-            SAVED_ACCOUNTS_FILE.write_text(
-                json.dumps(self.saved_accounts, ensure_ascii=False, indent=2),
-                encoding="utf-8",
-            )
-        except Exception:
+            self._save_queue.get_nowait()
+        except queue.Empty:
             pass
+        self._save_queue.put(blob)
+
+    def _account_writer(self) -> None:
+        tmp_path = SAVED_ACCOUNTS_FILE.with_suffix(".json.tmp")
+        while True:
+            blob = self._save_queue.get()
+            if blob is None:
+                return
+            try:
+                tmp_path.write_bytes(blob)
+                os.replace(tmp_path, SAVED_ACCOUNTS_FILE)
+            except Exception:
+                pass
 
     def _refresh_saved_accounts_ui(self) -> None:
         values = list(self.saved_accounts)
-        self.saved_accounts_combo.configure(values=values)
+        if self._accounts_version != self._last_refreshed_version:
+            self.saved_accounts_combo.configure(values=values)
+            self._last_refreshed_version = self._accounts_version
         current = self.saved_account_var.get().strip()
         if values:
             if not current or current not in values:
@@ -121,13 +179,21 @@ class InstagramCleanerApp:
         else:
             self.saved_account_var.set("")
 
+    def _rebuild_saved_index(self) -> None:
+        # Lowercase-key lookup so mutations avoid re-lowercasing the whole list.
+        self._saved_index = {name.lower(): i for i, name in enumerate(self.saved_accounts)}
+
     def _remember_account(self, username: str) -> None:
-        account = username.strip().lstrip("@")
+        account = _clean_account(username)
         if not account:
             return
-        existing = [item for item in self.saved_accounts if item.lower() != account.lower()]
-        self.saved_accounts = [account] + existing
-        self.saved_accounts = self.saved_accounts[:20]
+        old_index = self._saved_index.get(account.lower())
+        if old_index is not None:
+            self.saved_accounts.pop(old_index)
+        self.saved_accounts.insert(0, account)
+        del self.saved_accounts[20:]
+        self._rebuild_saved_index()
+        self._accounts_version += 1
         self._save_saved_accounts()
         self._refresh_saved_accounts_ui()
 
@@ -140,11 +206,17 @@ class InstagramCleanerApp:
         selected = self.saved_account_var.get().strip()
         if not selected:
             return
-        self.saved_accounts = [item for item in self.saved_accounts if item.lower() != selected.lower()]
+        index = self._saved_index.get(selected.lower())
+        if index is None:
+            return
+        del self.saved_accounts[index]
+        self._rebuild_saved_index()
+        self._accounts_version += 1
         self._save_saved_accounts()
         self._refresh_saved_accounts_ui()
 
     def _build_ui(self) -> None:
+        pad = {"padx": 6, "pady": 8}
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(2, weight=1)
         self.root.rowconfigure(3, weight=1)
@@ -154,20 +226,20 @@ class InstagramCleanerApp:
         login_frame.grid(row=0, column=0, padx=12, pady=(12, 8), sticky="ew")
         login_frame.columnconfigure(1, weight=1)
 
-        ttk.Label(login_frame, text="Username (for account profile)").grid(row=0, column=0, padx=6, pady=8, sticky="w")
+        ttk.Label(login_frame, text="Username (for account profile)").grid(row=0, column=0, **pad, sticky="w")
         ttk.Entry(login_frame, textvariable=self.username_var).grid(
-            row=0, column=1, padx=6, pady=8, sticky="ew"
+            row=0, column=1, **pad, sticky="ew"
         )
 
         self.login_button = ttk.Button(login_frame, text="Login", style="Accent.TButton", command=self.login)
-        self.login_button.grid(row=0, column=2, padx=6, pady=8)
+        self.login_button.grid(row=0, column=2, **pad)
 
         self.login_other_button = ttk.Button(
             login_frame,
             text="Login Another",
             command=self.login_another_account,
         )
-        self.login_other_button.grid(row=0, column=3, padx=6, pady=8)
+        self.login_other_button.grid(row=0, column=3, **pad)
 
         ttk.Label(
             login_frame,
@@ -175,24 +247,24 @@ class InstagramCleanerApp:
             foreground="#53627a",
         ).grid(row=1, column=1, columnspan=3, padx=8, pady=(2, 8), sticky="w")
 
-        ttk.Label(login_frame, text="Saved accounts").grid(row=2, column=0, padx=6, pady=8, sticky="w")
+        ttk.Label(login_frame, text="Saved accounts").grid(row=2, column=0, **pad, sticky="w")
         self.saved_accounts_combo = ttk.Combobox(
             login_frame,
             textvariable=self.saved_account_var,
             state="readonly",
             values=self.saved_accounts,
         )
-        self.saved_accounts_combo.grid(row=2, column=1, padx=6, pady=8, sticky="ew")
+        self.saved_accounts_combo.grid(row=2, column=1, **pad, sticky="ew")
         ttk.Button(login_frame, text="Use", command=self.use_selected_account).grid(
-            row=2, column=2, padx=6, pady=8
+            row=2, column=2, **pad
         )
         ttk.Button(login_frame, text="Remove", command=self.remove_selected_account).grid(
-            row=2, column=3, padx=6, pady=8
+            row=2, column=3, **pad
         )
 
         action_frame = ttk.LabelFrame(self.root, text="Actions")
         action_frame.grid(row=1, column=0, padx=12, pady=(0, 8), sticky="ew")
-        action_frame.columnconfigure(5, weight=1)
+        action_frame.columnconfigure(6, weight=1)
 
         self.fetch_button = ttk.Button(
             action_frame,
@@ -200,7 +272,7 @@ class InstagramCleanerApp:
             command=self.fetch_non_followers,
             state=tk.DISABLED,
         )
-        self.fetch_button.grid(row=0, column=0, padx=6, pady=8)
+        self.fetch_button.grid(row=0, column=0, **pad)
 
         self.unfollow_selected_button = ttk.Button(
             action_frame,
@@ -208,7 +280,7 @@ class InstagramCleanerApp:
             command=self.unfollow_selected,
             state=tk.DISABLED,
         )
-        self.unfollow_selected_button.grid(row=0, column=1, padx=6, pady=8)
+        self.unfollow_selected_button.grid(row=0, column=1, **pad)
 
         self.unfollow_all_button = ttk.Button(
             action_frame,
@@ -216,12 +288,20 @@ class InstagramCleanerApp:
             command=self.unfollow_all,
             state=tk.DISABLED,
         )
-        self.unfollow_all_button.grid(row=0, column=2, padx=6, pady=8)
+        self.unfollow_all_button.grid(row=0, column=2, **pad)
 
-        ttk.Label(action_frame, text="Delay (sec)").grid(row=0, column=3, padx=(18, 4), pady=8)
-        ttk.Entry(action_frame, textvariable=self.delay_var, width=6).grid(row=0, column=4, padx=4, pady=8)
+        self.stop_button = ttk.Button(
+            action_frame,
+            text="Stop",
+            command=self.cancel_unfollow,
+            state=tk.DISABLED,
+        )
+        self.stop_button.grid(row=0, column=3, **pad)
+
+        ttk.Label(action_frame, text="Delay (sec)").grid(row=0, column=4, padx=(18, 4), pady=8)
+        ttk.Entry(action_frame, textvariable=self.delay_var, width=6).grid(row=0, column=5, padx=4, pady=8)
         ttk.Label(action_frame, text="Use 0.3-1.5 seconds for faster flow (higher risk).").grid(
-            row=0, column=5, padx=8, pady=8, sticky="w"
+            row=0, column=6, padx=8, pady=8, sticky="w"
         )
 
         list_frame = ttk.LabelFrame(self.root, text="Accounts Not Following You Back")
@@ -241,33 +321,19 @@ class InstagramCleanerApp:
             highlightbackground="#d5deef",
             highlightcolor="#4f7dff",
             activestyle="none",
+            yscrollcommand=self._on_list_scroll,
         )
         self.user_list.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
-        list_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.user_list.yview)
-        list_scroll.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
-        self.user_list.configure(yscrollcommand=list_scroll.set)
+        self.list_scroll = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.user_list.yview)
+        self.list_scroll.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
 
-        log_frame = ttk.LabelFrame(self.root, text="Log")
-        log_frame.grid(row=3, column=0, padx=12, pady=(0, 12), sticky="nsew")
-        log_frame.columnconfigure(0, weight=1)
-        log_frame.rowconfigure(0, weight=1)
-
-        self.log_text = tk.Text(
-            log_frame,
-            state=tk.DISABLED,
-            height=9,
-            bg="white",
-            fg="#1f2d3d",
-            borderwidth=0,
-            highlightthickness=1,
-            highlightbackground="#d5deef",
-            highlightcolor="#4f7dff",
-            insertbackground="#1f2d3d",
-        )
-        self.log_text.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
-        log_scroll = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, command=self.log_text.yview)
-        log_scroll.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
-        self.log_text.configure(yscrollcommand=log_scroll.set)
+        # The Text widget itself is created lazily by _ensure_log_widget on the
+        # first log flush; realizing it here slows first paint.
+        self._log_frame = ttk.LabelFrame(self.root, text="Log")
+        self._log_frame.grid(row=3, column=0, padx=12, pady=(0, 12), sticky="nsew")
+        self._log_frame.columnconfigure(0, weight=1)
+        self._log_frame.rowconfigure(0, weight=1)
+        self.log_text: tk.Text | None = None
 
         detector_frame = ttk.LabelFrame(self.root, text="Error Detector")
         detector_frame.grid(row=4, column=0, padx=12, pady=(0, 12), sticky="ew")
@@ -281,15 +347,56 @@ class InstagramCleanerApp:
         self._refresh_saved_accounts_ui()
         self.log("Application started. Click Login to open Chrome and sign in.")
         self._set_detector("INFO", "Ready to login.")
+        self.root.after(100, self._drain_log)
 
     def log(self, text: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"[{timestamp}] {text}\n")
-        self.log_text.see(tk.END)
-        self.log_text.configure(state=tk.DISABLED)
+        # Thread-safe: deque.append is atomic, so workers can log directly
+        # without a root.after hop. The Text widget is updated by _drain_log.
+        timestamp = time.strftime("%H:%M:%S")
+        self._log_queue.append(f"[{timestamp}] {text}\n")
+
+    def _ensure_log_widget(self) -> None:
+        if self.log_text is not None:
+            return
+        log_scroll = ttk.Scrollbar(self._log_frame, orient=tk.VERTICAL)
+        self.log_text = tk.Text(
+            self._log_frame,
+            state=tk.DISABLED,
+            height=9,
+            bg="white",
+            fg="#1f2d3d",
+            borderwidth=0,
+            highlightthickness=1,
+            highlightbackground="#d5deef",
+            highlightcolor="#4f7dff",
+            insertbackground="#1f2d3d",
+            yscrollcommand=log_scroll.set,
+        )
+        self.log_text.grid(row=0, column=0, sticky="nsew", padx=(8, 0), pady=8)
+        log_scroll.configure(command=self.log_text.yview)
+        log_scroll.grid(row=0, column=1, sticky="ns", padx=(0, 8), pady=8)
+
+    def _drain_log(self) -> None:
+        if self._log_queue:
+            self._ensure_log_widget()
+            lines = []
+            while self._log_queue:
+                lines.append(self._log_queue.popleft())
+            self.log_text.configure(state=tk.NORMAL)
+            self.log_text.insert(tk.END, "".join(lines))
+            # Keep only the most recent lines so long runs do not grow Tk's
+            # text storage (and redraw cost) without bound.
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > 2000:
+                self.log_text.delete("1.0", f"{line_count - 2000}.0")
+            self.log_text.see(tk.END)
+            self.log_text.configure(state=tk.DISABLED)
+        self.root.after(100, self._drain_log)
 
     def _set_action_buttons(self, enabled: bool) -> None:
+        if enabled == self._action_buttons_enabled:
+            return
+        self._action_buttons_enabled = enabled
         state = tk.NORMAL if enabled else tk.DISABLED
         self.fetch_button.configure(state=state)
         self.unfollow_selected_button.configure(state=state)
@@ -301,19 +408,14 @@ class InstagramCleanerApp:
         self.login_other_button.configure(state=state)
 
     def _run_async(self, work) -> None:
-        thread = threading.Thread(target=work, daemon=True)
-        thread.start()
+        # All service work is I/O-bound; run it through one shared event loop
+        # thread instead of spawning a fresh daemon thread per action.
+        asyncio.run_coroutine_threadsafe(asyncio.to_thread(work), self._loop)
 
     def _set_detector(self, level: str, message: str) -> None:
-        color_map = {
-            "SUCCESS": "#1f7a3f",
-            "WARNING": "#a85a00",
-            "ERROR": "#b42318",
-            "INFO": "#1f5faa",
-        }
         self.status_var.set(f"Status: {level}")
         self.detector_var.set(f"Error Detector: {message}")
-        level_color = color_map.get(level, "#1f5faa")
+        level_color = self._DETECTOR_COLORS.get(level, "#1f5faa")
         self.status_label.configure(foreground=level_color)
 
     def login(self) -> None:
@@ -325,7 +427,7 @@ class InstagramCleanerApp:
     def _on_login_success(self, auto_scan: bool = False) -> None:
         self._set_login_buttons(True)
         self._set_action_buttons(True)
-        active_username = (self.service.username or "").strip().lstrip("@")
+        active_username = _clean_account(self.service.username or "")
         if active_username:
             self.username_var.set(active_username)
             self._remember_account(active_username)
@@ -376,10 +478,25 @@ class InstagramCleanerApp:
 
     def fetch_non_followers(self) -> None:
         self._set_action_buttons(False)
-        self.log("Loading accounts. This may take some time for large accounts...")
+        # A second press while cached results are showing rescans for real.
+        force_refresh = self._last_fetch_from_cache
+        if force_refresh:
+            self.log("Rescanning now (ignoring cached results)...")
+        else:
+            self.log("Loading accounts. This may take some time for large accounts...")
         self.last_scan_counts = {"following": 0, "followers": 0}
         scan_progress = {"following": -1, "followers": -1}
         scan_completed: set[str] = set()
+        last_emit = {"following": 0.0, "followers": 0.0}
+
+        def should_emit(relation_key: str) -> bool:
+            # At most ~4 progress lines per second per relation; a user cannot
+            # read more, and large accounts otherwise flood the log queue.
+            now = time.monotonic()
+            if now - last_emit[relation_key] < 0.25:
+                return False
+            last_emit[relation_key] = now
+            return True
 
         def scan_update(relation: str, count: int) -> None:
             if relation not in scan_progress:
@@ -394,39 +511,26 @@ class InstagramCleanerApp:
             if previous < 0:
                 scan_progress[relation_key] = count
                 self.last_scan_counts[relation_key] = count
-                self.root.after(
-                    0,
-                    lambda label=label, count=count: self.log(
-                        f"Scanning {label}: {count} account(s) loaded..."
-                    ),
-                )
+                self.log(f"Scanning {label}: {count} account(s) loaded...")
                 return
 
             if count > previous:
                 scan_progress[relation_key] = count
                 self.last_scan_counts[relation_key] = count
-                if count <= 50 or (count - previous) >= 5:
-                    self.root.after(
-                        0,
-                        lambda label=label, count=count: self.log(
-                            f"Scanning {label}: {count} account(s) loaded..."
-                        ),
-                    )
+                if (count <= 50 or (count - previous) >= 5) and should_emit(relation_key):
+                    self.log(f"Scanning {label}: {count} account(s) loaded...")
                 return
 
             if count == previous and relation_key not in scan_completed:
                 scan_completed.add(relation_key)
                 self.last_scan_counts[relation_key] = count
-                self.root.after(
-                    0,
-                    lambda label=label, count=count: self.log(
-                        f"Finished scanning {label}: {count} account(s)."
-                    ),
-                )
+                self.log(f"Finished scanning {label}: {count} account(s).")
 
         def work() -> None:
             try:
-                users = self.service.get_not_following_back(progress_callback=scan_update)
+                users = self.service.get_not_following_back(
+                    progress_callback=scan_update, force_refresh=force_refresh
+                )
             except InstagramServiceError as exc:
                 self.root.after(0, lambda: self._on_fetch_failed(str(exc)))
                 return
@@ -434,17 +538,58 @@ class InstagramCleanerApp:
 
         self._run_async(work)
 
+    def _repopulate_user_list(self, users: list[str]) -> None:
+        # Virtual-list style rendering: only materialize Listbox rows in
+        # chunks as the user scrolls, so 50k+ results do not sit in Tk.
+        # _render_limit is reset before the Tcl call because delete() fires
+        # the yscrollcommand synchronously.
+        self._render_limit = 0
+        self.user_list.delete(0, tk.END)
+        self._extend_user_list()
+
+    def _extend_user_list(self) -> None:
+        total = len(self.non_followers)
+        if self._render_limit >= total:
+            return
+        start = self._render_limit
+        end = min(start + self._RENDER_CHUNK, total)
+        # Bump the limit first: insert() re-enters _on_list_scroll, and the
+        # deferred extend must see the rows below as already materialized.
+        self._render_limit = end
+        self.user_list.insert(tk.END, *self.non_followers[start:end])
+
+    def _on_list_scroll(self, first: str, last: str) -> None:
+        self.list_scroll.set(first, last)
+        # Nearing the bottom of the rendered rows: materialize the next chunk.
+        # Tk calls this from inside insert/delete, so never mutate the Listbox
+        # here directly — defer to idle time, and only one extend at a time.
+        if float(last) > 0.9 and not self._list_extend_pending:
+            self._list_extend_pending = True
+            self.root.after_idle(self._deferred_extend_user_list)
+
+    def _deferred_extend_user_list(self) -> None:
+        self._list_extend_pending = False
+        self._extend_user_list()
+
     def _on_fetch_success(self, users: list[str]) -> None:
         self.non_followers = users
-        self.user_list.delete(0, tk.END)
-        for username in users:
-            self.user_list.insert(tk.END, username)
+        self._repopulate_user_list(users)
         self._set_action_buttons(True)
-        self.log(
-            "Scan totals: "
-            f"following={self.last_scan_counts.get('following', 0)}, "
-            f"followers={self.last_scan_counts.get('followers', 0)}."
-        )
+        cache_age = self.service.last_result_cache_age
+        self._last_fetch_from_cache = cache_age is not None
+        if cache_age is not None:
+            minutes = int(cache_age // 60)
+            age_text = f"{minutes} minute(s)" if minutes else f"{int(cache_age)} second(s)"
+            self.log(
+                f"Loaded cached results from {age_text} ago. "
+                "Press the button again to rescan now."
+            )
+        else:
+            self.log(
+                "Scan totals: "
+                f"following={self.last_scan_counts.get('following', 0)}, "
+                f"followers={self.last_scan_counts.get('followers', 0)}."
+            )
         self.log(f"Found {len(users)} account(s) not following you back.")
         self._set_detector("SUCCESS", f"Data loaded successfully. Found {len(users)} account(s).")
 
@@ -455,11 +600,13 @@ class InstagramCleanerApp:
         messagebox.showerror(APP_TITLE, error_text)
 
     def unfollow_selected(self) -> None:
-        indexes = list(self.user_list.curselection())
+        indexes = self.user_list.curselection()
         if not indexes:
             messagebox.showwarning(APP_TITLE, "Select at least one account.")
             return
-        selected = [self.user_list.get(i) for i in indexes]
+        # self.non_followers mirrors the Listbox rows, so read the model
+        # instead of issuing one Tcl get() per selected index.
+        selected = [self.non_followers[i] for i in indexes]
         self._start_unfollow(selected)
 
     def unfollow_all(self) -> None:
@@ -468,6 +615,11 @@ class InstagramCleanerApp:
             return
         self._start_unfollow(list(self.non_followers))
 
+    def cancel_unfollow(self) -> None:
+        self._unfollow_stop.set()
+        self.stop_button.configure(state=tk.DISABLED)
+        self.log("Stopping after the current account...")
+
     def _start_unfollow(self, usernames: list[str]) -> None:
         delay = self._parse_delay()
         if delay is None:
@@ -480,23 +632,27 @@ class InstagramCleanerApp:
             return
 
         self._set_action_buttons(False)
+        self._unfollow_stop.clear()
+        self.stop_button.configure(state=tk.NORMAL)
         self.log(f"Starting unfollow for {len(usernames)} account(s).")
 
         def progress(done: int, total: int, username: str, success: bool, error: str) -> None:
-            def update_log() -> None:
-                if success:
-                    if error:
-                        self.log(f"{done}/{total} skipped @{username}: {error}")
-                    else:
-                        self.log(f"{done}/{total} unfollowed @{username}")
+            if success:
+                if error:
+                    self.log(f"{done}/{total} skipped @{username}: {error}")
                 else:
-                    self.log(f"{done}/{total} failed @{username}: {error}")
-
-            self.root.after(0, update_log)
+                    self.log(f"{done}/{total} unfollowed @{username}")
+            else:
+                self.log(f"{done}/{total} failed @{username}: {error}")
 
         def work() -> None:
             try:
-                result = self.service.unfollow_users(usernames, delay_seconds=delay, progress_callback=progress)
+                result = self.service.unfollow_users(
+                    usernames,
+                    delay_seconds=delay,
+                    progress_callback=progress,
+                    stop_event=self._unfollow_stop,
+                )
             except InstagramServiceError as exc:
                 self.root.after(0, lambda: self._on_unfollow_failed(str(exc)))
                 return
@@ -504,18 +660,40 @@ class InstagramCleanerApp:
 
         self._run_async(work)
 
-    def _on_unfollow_finished(self, result: dict[str, list[str]]) -> None:
-        removed = set(result.get("removed", []))
-        skipped = set(result.get("skipped", []))
+    def _delete_processed_rows(self, processed: frozenset[str]) -> None:
+        # Delete only the removed rows (as coalesced index ranges, back to
+        # front) instead of clearing and re-inserting every surviving row.
+        ranges: list[list[int]] = []
+        for index, username in enumerate(self.non_followers):
+            if username not in processed:
+                continue
+            if ranges and ranges[-1][1] == index - 1:
+                ranges[-1][1] = index
+            else:
+                ranges.append([index, index])
+        for start, end in reversed(ranges):
+            rendered_end = min(end, self._render_limit - 1) if start < self._render_limit else -1
+            # Update the model and limit before the Tcl delete: it re-enters
+            # _on_list_scroll, and the deferred extend must not see the
+            # half-updated state.
+            del self.non_followers[start : end + 1]
+            if rendered_end >= start:
+                self._render_limit -= rendered_end - start + 1
+                self.user_list.delete(start, rendered_end)
+        self._extend_user_list()
+
+    def _on_unfollow_finished(self, result: dict[str, frozenset[str] | list[str]]) -> None:
+        removed = result.get("removed", frozenset())
+        skipped = result.get("skipped", frozenset())
         failed = result.get("failed", [])
         processed = removed | skipped
         if processed:
-            self.non_followers = [username for username in self.non_followers if username not in processed]
-            self.user_list.delete(0, tk.END)
-            for username in self.non_followers:
-                self.user_list.insert(tk.END, username)
+            self._delete_processed_rows(processed)
 
         self._set_action_buttons(True)
+        self.stop_button.configure(state=tk.DISABLED)
+        if self._unfollow_stop.is_set():
+            self.log("Unfollow stopped by request.")
         self.log(
             "Unfollow done. "
             f"Removed: {len(result.get('removed', []))}, "
@@ -534,6 +712,7 @@ class InstagramCleanerApp:
 
     def _on_unfollow_failed(self, error_text: str) -> None:
         self._set_action_buttons(True)
+        self.stop_button.configure(state=tk.DISABLED)
         self.log(f"Unfollow failed: {error_text}")
         self._set_detector("ERROR", error_text)
         messagebox.showerror(APP_TITLE, error_text)
@@ -550,10 +729,26 @@ class InstagramCleanerApp:
         return delay
 
     def on_close(self) -> None:
+        # A batch still running on the worker loop stops at the next pacing
+        # wait instead of sleeping it out against a closed window.
+        self._unfollow_stop.set()
+        # Retire the account writer before closing: a sentinel makes it drain
+        # any queued save in order and exit, instead of this thread racing it
+        # for the same file. The put blocks while the queue still holds a
+        # pending blob, so both timeouts bound the shutdown.
+        try:
+            self._save_queue.put(None, timeout=5.0)
+            self._save_thread.join(timeout=5.0)
+        except queue.Full:
+            pass
         try:
             self.service.close_browser()
         except Exception:
             pass
+        try:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        except Exception:
+            pass
         self.root.destroy()
 
 
@@ -5,16 +5,36 @@ import re
 import shutil
 import threading
 import time
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Callable, Generator
 from urllib.parse import urlparse
 
 try:
-    import winreg
+    import orjson
+
+    def _json_loads(data: bytes | str):
+        return orjson.loads(data)
+
+    def _json_dumps(payload) -> bytes:
+        return orjson.dumps(payload)
+
 except ImportError:  # pragma: no cover
-    winreg = None
+    import json
+
+    def _json_loads(data: bytes | str):
+        return json.loads(data)
 
-import undetected_chromedriver as uc
+    def _json_dumps(payload) -> bytes:
+        return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+try:
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:  # pragma: no cover
+    _RLock = threading.RLock
+
+import urllib3
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
@@ -22,17 +42,99 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+if TYPE_CHECKING:  # pragma: no cover
+    import undetected_chromedriver as uc
+
 
 class InstagramServiceError(Exception):
     """Raised when an Instagram operation fails."""
 
 
-ProgressCallback = Callable[[int, int, str, bool, str], None]
-ListScanCallback = Callable[[str, int], None]
+def _clean_username(value: str) -> str:
+    """Strip whitespace and any leading @ from a username."""
+    value = value.strip()
+    return value.lstrip("@") if value.startswith("@") else value
+
+
+_WS_RE = re.compile(r"\s+")
+
+
+def _normalize_text_uncached(value: str) -> str:
+    # The common all-ASCII case runs at bytes level and never touches the
+    # unicode-aware regex machinery.
+    if value.isascii():
+        return b" ".join(value.encode("ascii").lower().split()).decode("ascii")
+    return _WS_RE.sub(" ", value).strip().lower()
+
+
+@lru_cache(maxsize=1024)
+def _normalize_label_cached(value: str) -> str:
+    return _normalize_text_uncached(value)
+
+
+def _normalize_label(value: str) -> str:
+    # Labels like "Following" repeat on every poll, so cache the normalized
+    # form — but only for short label-like strings. The blocked-message scan
+    # routes whole-page innerText through here, and pinning up to 1024 page
+    # dumps in the cache would defeat it and bloat memory.
+    if len(value) > 64:
+        return _normalize_text_uncached(value)
+    return _normalize_label_cached(value)
+
+
+def _compile_keyword_matcher(
+    keywords: set[str],
+    word_boundaries: bool = True,
+) -> tuple[frozenset[str], re.Pattern[str] | None, tuple[str, ...]]:
+    """Build an (exact set, regex, non-ascii keywords) matcher, compiled once.
+
+    The exact frozenset short-circuits the common case where the normalized
+    text is literally one of the keywords ("follow", "following"). ASCII
+    keywords collapse into a single alternation pattern (with word boundaries
+    unless disabled); non-ASCII keywords keep the plain substring check since
+    the boundary classes only cover ASCII word characters.
+    """
+    normalized = [_normalize_label(keyword) for keyword in keywords]
+    ascii_keywords = sorted(
+        (keyword for keyword in normalized if keyword and keyword.isascii()),
+        key=len,
+        reverse=True,
+    )
+    other = tuple(keyword for keyword in normalized if keyword and not keyword.isascii())
+    pattern = None
+    if ascii_keywords:
+        if word_boundaries:
+            parts = (
+                rf"(?<![a-z0-9_]){re.escape(keyword)}(?![a-z0-9_])"
+                for keyword in ascii_keywords
+            )
+        else:
+            parts = (re.escape(keyword) for keyword in ascii_keywords)
+        # The alternation only ever contains ASCII keywords, so opt out of the
+        # unicode-aware matching machinery.
+        pattern = re.compile("|".join(parts), re.ASCII)
+    return frozenset(keyword for keyword in normalized if keyword), pattern, other
+
+
+def _match_keywords(
+    text: str,
+    matcher: tuple[frozenset[str], re.Pattern[str] | None, tuple[str, ...]],
+) -> bool:
+    if not text:
+        return False
+    exact, pattern, other = matcher
+    if text in exact:
+        return True
+    if pattern is not None and pattern.search(text):
+        return True
+    return any(keyword in text for keyword in other)
 
 
-class InstagramService:
-    RESERVED_PATHS = {
+_PROFILE_KEY_RE = re.compile(r"[^a-z0-9._-]+")
+_USERNAME_RE = re.compile(r"^[A-Za-z0-9._]+$")
+
+_RESERVED_PATHS = frozenset(
+    {
         "accounts",
         "about",
         "api",
@@ -48,6 +150,78 @@ class InstagramService:
         "p",
         "tv",
     }
+)
+
+
+@lru_cache(maxsize=4096)
+def _href_username(href: str) -> str | None:
+    """Pull the username out of a profile href, or None for non-profile links.
+
+    Runs once per scraped link (10k+ times on big scans), so the path is
+    extracted with plain slicing instead of a full urlparse and results are
+    memoized — the same hrefs reappear across scroll rounds.
+    """
+    if not href:
+        return None
+
+    path = href
+    scheme_end = path.find("://")
+    if scheme_end != -1:
+        slash = path.find("/", scheme_end + 3)
+        path = path[slash:] if slash != -1 else ""
+    elif path.startswith("//"):
+        # Scheme-relative href: drop the host segment too.
+        slash = path.find("/", 2)
+        path = path[slash:] if slash != -1 else ""
+    path = path.split("?", 1)[0].split("#", 1)[0]
+
+    clean = path.strip("/")
+    if not clean:
+        return None
+    first = clean.split("/", 1)[0]
+    if not first:
+        return None
+
+    if first.lower() in _RESERVED_PATHS:
+        return None
+
+    if not _USERNAME_RE.match(first):
+        return None
+
+    return first
+
+_FRIENDSHIP_URL_RE = re.compile(r"/api/v1/friendships/\d+/(followers|following)/")
+
+_DIGIT_TRANS = str.maketrans(
+    "٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹٬٫",
+    "01234567890123456789,.",
+)
+
+_NUMBER_PATTERN = r"([0-9][0-9,\.]*\s*[kmb]?)"
+_NUMBER_RE = re.compile(_NUMBER_PATTERN)
+
+# label <-> count patterns, precompiled per relation instead of re-escaped on
+# every _parse_relation_count call.
+_RELATION_COUNT_PATTERNS: dict[str, list[re.Pattern[str]]] = {}
+for _relation, _labels in {
+    "following": ["following", "يتابع", "المتابعة"],
+    "followers": ["followers", "متابع", "المتابعين"],
+}.items():
+    _patterns: list[re.Pattern[str]] = []
+    for _label in _labels:
+        _label_norm = _normalize_label(_label)
+        _patterns.append(re.compile(_NUMBER_PATTERN + r"\s*" + re.escape(_label_norm)))
+        _patterns.append(re.compile(re.escape(_label_norm) + r"\s*" + _NUMBER_PATTERN))
+    _RELATION_COUNT_PATTERNS[_relation] = _patterns
+del _relation, _labels, _patterns, _label, _label_norm
+
+
+ProgressCallback = Callable[[int, int, str, bool, str], None]
+ListScanCallback = Callable[[str, int], None]
+
+
+class InstagramService:
+    RESERVED_PATHS = _RESERVED_PATHS
 
     FOLLOW_KEYWORDS = {
         "follow",
@@ -84,14 +258,61 @@ class InstagramService:
         "يرجى الانتظار",
     }
 
+    # Keyword matchers compiled once at class creation; the blocked-message
+    # scan keeps plain substring semantics, so no word boundaries there.
+    _FOLLOW_MATCHER = _compile_keyword_matcher(FOLLOW_KEYWORDS)
+    _FOLLOWING_MATCHER = _compile_keyword_matcher(FOLLOWING_KEYWORDS)
+    _UNFOLLOW_MATCHER = _compile_keyword_matcher(UNFOLLOW_KEYWORDS)
+    _BLOCKED_MATCHER = _compile_keyword_matcher(ACTION_BLOCKED_KEYWORDS, word_boundaries=False)
+    _UNFOLLOW_LABELS = tuple(sorted(_normalize_label(keyword) for keyword in UNFOLLOW_KEYWORDS))
+    _FOLLOW_LABELS = tuple(sorted(_normalize_label(keyword) for keyword in FOLLOW_KEYWORDS))
+    _FOLLOWING_LABELS = tuple(sorted(_normalize_label(keyword) for keyword in FOLLOWING_KEYWORDS))
+    _BLOCKED_LABELS = tuple(sorted(_normalize_label(keyword) for keyword in ACTION_BLOCKED_KEYWORDS))
+
+    SCAN_CACHE_TTL_SECONDS = 600
+    UNFOLLOW_JOURNAL_TTL_SECONDS = 86400
+    DRIVER_POOL_MAX = 3
+
+    # Avatars, fonts and clips are dead weight for username extraction; the
+    # relation-list XHRs themselves are JSON and unaffected by these globs.
+    # Network.setBlockedURLs patterns match the full URL, and Instagram CDN
+    # media always carries a query string, so each extension needs a trailing
+    # wildcard to actually match.
+    SCAN_BLOCKED_URL_PATTERNS = [
+        "*.jpg*",
+        "*.jpeg*",
+        "*.png*",
+        "*.webp*",
+        "*.gif*",
+        "*.mp4*",
+        "*.woff*",
+    ]
+
     def __init__(self, session_path: str) -> None:
         self.session_path = Path(session_path)
+        self.cache_path = self.session_path.with_suffix(".cache.json")
+        self.journal_path = self.session_path.with_suffix(".unfollow.jsonl")
         self.profiles_root = Path("chrome_profiles")
         self.active_profile_key = "default"
         self.profile_dir = self.profiles_root / self.active_profile_key
         self.driver = None
-        self.lock = threading.RLock()
+        self.lock = _RLock()
         self.username: str | None = None
+        self._chrome_path: str | None = None
+        self._chrome_path_checked = False
+        self._last_cache_key: tuple[str | None, tuple[str, ...]] | None = None
+        # Age (seconds) of the cache entry behind the last
+        # get_not_following_back result, or None when it came from a scan.
+        self.last_result_cache_age: float | None = None
+        self._driver_pool: OrderedDict[str, uc.Chrome] = OrderedDict()
+        self._xhr_usernames: dict[str, set[str]] = {}
+        # username (lowercase) -> numeric user id, filled for free from the
+        # friendships XHRs; lets the API unfollow path skip its id lookup.
+        self._username_to_id: dict[str, str] = {}
+        # Pacing state left behind by the last unfollow batch, so a follow-up
+        # batch does not reset to base delay right after an action block.
+        self._unfollow_backoff_delay = 0.0
+        self._unfollow_backoff_at = 0.0
 
     def login(self, username: str, password: str, verification_code: str = "") -> None:
         raise InstagramServiceError("Password login is disabled. Use browser login only.")
@@ -102,7 +323,7 @@ class InstagramService:
         timeout_seconds: int = 300,
         force_new: bool = False,
     ) -> None:
-        username = username.strip().lstrip("@")
+        username = _clean_username(username)
 
         with self.lock:
             self._select_profile_for_login(username, force_new=force_new)
@@ -123,18 +344,35 @@ class InstagramService:
                 )
 
     def _select_profile_for_login(self, username: str, force_new: bool = False) -> None:
+        # Park the current driver instead of quitting it, so switching back to
+        # a recently used account skips the Chrome cold start. force_new reuses
+        # the warm driver too; _clear_instagram_session wipes its session.
         key = self._profile_key(username)
-        restart_required = force_new or key != self.active_profile_key
-        if restart_required and self.driver is not None:
-            self.close_browser()
+        if key != self.active_profile_key and self.driver is not None:
+            self._park_driver(self.active_profile_key)
         self.active_profile_key = key
         self.profile_dir = self.profiles_root / key
+        if self.driver is None:
+            self.driver = self._driver_pool.pop(key, None)
+
+    def _park_driver(self, key: str) -> None:
+        if self.driver is None:
+            return
+        self._driver_pool[key] = self.driver
+        self._driver_pool.move_to_end(key)
+        self.driver = None
+        while len(self._driver_pool) > self.DRIVER_POOL_MAX:
+            _, evicted = self._driver_pool.popitem(last=False)
+            try:
+                evicted.quit()
+            except Exception:
+                pass
 
     def _profile_key(self, username: str) -> str:
-        value = username.strip().lstrip("@").lower()
+        value = _clean_username(username).lower()
         if not value:
             return "default"
-        cleaned = re.sub(r"[^a-z0-9._-]+", "_", value).strip("._-")
+        cleaned = _PROFILE_KEY_RE.sub("_", value).strip("._-")
         return cleaned or "default"
 
     def _clear_instagram_session(self) -> None:
@@ -144,23 +382,19 @@ class InstagramService:
         except Exception:
             pass
 
-        try:
-            self.driver.delete_all_cookies()
-        except Exception:
-            pass
-
-        try:
-            self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
-        except Exception:
-            pass
-
+        # Storage.clearDataForOrigin with "all" already covers cookies, so the
+        # separate delete_all_cookies / Network.clearBrowserCookies round-trips
+        # are redundant; keep cookie deletion only as the CDP fallback.
         try:
             self.driver.execute_cdp_cmd(
                 "Storage.clearDataForOrigin",
                 {"origin": "https://www.instagram.com", "storageTypes": "all"},
             )
         except Exception:
-            pass
+            try:
+                self.driver.delete_all_cookies()
+            except Exception:
+                pass
 
         try:
             self.driver.execute_script(
@@ -172,80 +406,323 @@ class InstagramService:
     def get_not_following_back(
         self,
         progress_callback: ListScanCallback | None = None,
+        force_refresh: bool = False,
     ) -> list[str]:
         with self.lock:
             self._ensure_logged_in()
-            following = self._collect_user_list(
-                self.username,
-                "following",
-                progress_callback=progress_callback,
-            )
-            followers = self._collect_user_list(
-                self.username,
-                "followers",
-                progress_callback=progress_callback,
-            )
-
-        not_following_back = sorted((set(following) - set(followers)), key=str.lower)
+            if not force_refresh:
+                cached = self._load_scan_cache()
+                if cached is not None:
+                    users, age = cached
+                    self.last_result_cache_age = age
+                    return users
+            self.last_result_cache_age = None
+            self._xhr_usernames = {"following": set(), "followers": set()}
+            pair = self._collect_user_sets_parallel(progress_callback=progress_callback)
+            if pair is not None:
+                following, followers = pair
+            else:
+                following = self._collect_user_set(
+                    self.username,
+                    "following",
+                    progress_callback=progress_callback,
+                )
+                followers = self._collect_user_set(
+                    self.username,
+                    "followers",
+                    progress_callback=progress_callback,
+                )
+            # Hash-based diff with case normalized once, so a follower whose
+            # href casing differs from the following entry still counts as a
+            # mutual.
+            followers_set = frozenset(name.lower() for name in followers)
+            del followers
+
+        not_following_back = sorted(
+            (name for name in following if name.lower() not in followers_set),
+            key=str.casefold,
+        )
+        self._save_scan_cache(not_following_back)
         return not_following_back
 
+    def _load_scan_cache(self) -> tuple[list[str], float] | None:
+        """Return (users, age in seconds) from a fresh cache, or None."""
+        try:
+            data = _json_loads(self.cache_path.read_bytes())
+        except Exception:
+            return None
+        if not isinstance(data, dict) or data.get("username") != self.username:
+            return None
+        fetched_at = data.get("fetched_at")
+        users = data.get("not_following_back")
+        if not isinstance(fetched_at, (int, float)) or not isinstance(users, list):
+            return None
+        age = time.time() - fetched_at
+        if age > self.SCAN_CACHE_TTL_SECONDS:
+            return None
+        return [entry for entry in users if isinstance(entry, str)], age
+
+    def _save_scan_cache(self, users: list[str]) -> None:
+        payload = {
+            "username": self.username,
+            "fetched_at": time.time(),
+            "not_following_back": users,
+        }
+        # Skip the disk write when a rescan produced the identical list; the
+        # older fetched_at only makes the TTL expire sooner, never later.
+        cache_key = (self.username, tuple(users))
+        if cache_key == self._last_cache_key:
+            return
+        # Write via a temp file + os.replace so a crash mid-write can never
+        # leave a truncated cache behind.
+        tmp_path = self.cache_path.with_suffix(".cache.tmp")
+        try:
+            tmp_path.write_bytes(_json_dumps(payload))
+            os.replace(tmp_path, self.cache_path)
+        except Exception:
+            return
+        self._last_cache_key = cache_key
+
+    def _invalidate_scan_cache(self) -> None:
+        self._last_cache_key = None
+        try:
+            self.cache_path.unlink()
+        except OSError:
+            pass
+
     def unfollow_users(
         self,
         usernames: list[str],
         delay_seconds: float = 2.0,
         progress_callback: ProgressCallback | None = None,
-    ) -> dict[str, list[str]]:
+        stop_event: threading.Event | None = None,
+    ) -> dict[str, frozenset[str] | list[str]]:
         with self.lock:
             self._ensure_logged_in()
 
             removed: list[str] = []
             skipped: list[str] = []
-            failed: list[str] = []
+            failed: list[tuple[str, str]] = []
             total = len(usernames)
 
-            for index, username in enumerate(usernames, start=1):
-                cleaned = username.strip().lstrip("@")
-                success = False
-                error_message = ""
-                did_unfollow = False
+            # Adaptive pacing: double the delay when Instagram pushes back,
+            # decay toward the user's configured delay on sustained success.
+            # Batches fired back-to-back inherit the previous batch's inflated
+            # delay instead of rediscovering the action block at base pace.
+            base_delay = max(delay_seconds, 0.2)
+            current_delay = base_delay
+            if (
+                self._unfollow_backoff_delay > base_delay
+                and time.monotonic() - self._unfollow_backoff_at < 600.0
+            ):
+                current_delay = self._unfollow_backoff_delay
+            consecutive_ok = 0
+
+            # Normalize the whole batch up front so the paced loop only sees
+            # clean names.
+            targets = [(username, _clean_username(username)) for username in usernames]
+
+            # Resolve unknown user ids up front with bounded in-page fetches;
+            # the destructive unfollow loop itself stays serial and paced.
+            self._prefetch_user_ids([cleaned for _, cleaned in targets])
+
+            # Crash/ban recovery: names journaled as unfollowed within the
+            # TTL are skipped instead of burning another action on them.
+            already_unfollowed = self._load_unfollow_journal()
+            try:
+                journal_file = self.journal_path.open("a", encoding="utf-8")
+            except OSError:
+                journal_file = None
 
-                if not cleaned:
-                    failed.append(f"{username}: empty username")
-                    if progress_callback:
-                        progress_callback(index, total, username, False, "Empty username.")
-                    continue
+            try:
+                for index, (username, cleaned) in enumerate(targets, start=1):
+                    if stop_event is not None and stop_event.is_set():
+                        break
+                    started_at = time.monotonic()
+                    success = False
+                    error_message = ""
+                    did_unfollow = False
+
+                    if not cleaned:
+                        failed.append((username, "empty username"))
+                        if progress_callback:
+                            progress_callback(index, total, username, False, "Empty username.")
+                        continue
 
-                try:
-                    success, error_message, did_unfollow = self._unfollow_single(cleaned)
-                    if success:
-                        if did_unfollow:
-                            removed.append(cleaned)
+                    if cleaned in already_unfollowed:
+                        skipped.append(cleaned)
+                        if progress_callback:
+                            progress_callback(
+                                index, total, cleaned, True, "Already unfollowed recently."
+                            )
+                        continue
+
+                    try:
+                        success, error_message, did_unfollow = self._unfollow_single(cleaned)
+                        if success:
+                            if did_unfollow:
+                                removed.append(cleaned)
+                            else:
+                                skipped.append(cleaned)
+                                if not error_message:
+                                    error_message = "Already not following."
+                            self._journal_unfollow(journal_file, cleaned)
                         else:
-                            skipped.append(cleaned)
-                            if not error_message:
-                                error_message = "Already not following."
+                            failed.append((cleaned, error_message))
+                    except Exception as exc:  # defensive to continue bulk flow
+                        error_message = str(exc)
+                        failed.append((cleaned, error_message))
+
+                    if progress_callback:
+                        progress_callback(index, total, cleaned, success, error_message)
+
+                    if not success and "blocked" in error_message.lower():
+                        consecutive_ok = 0
+                        current_delay = min(current_delay * 2, 60.0)
                     else:
-                        failed.append(f"{cleaned}: {error_message}")
-                except Exception as exc:  # defensive to continue bulk flow
-                    error_message = str(exc)
-                    failed.append(f"{cleaned}: {error_message}")
+                        consecutive_ok += 1
+                        if consecutive_ok >= 5 and current_delay > base_delay:
+                            current_delay = max(current_delay * 0.8, base_delay)
+
+                    if index < total:
+                        # Pace against a monotonic target so the time already spent
+                        # on the unfollow itself counts toward the delay. Waiting
+                        # on the stop event (when given) makes cancellation take
+                        # effect immediately instead of after the full delay.
+                        remaining = max(0.0, started_at + current_delay - time.monotonic())
+                        if stop_event is not None:
+                            stop_event.wait(remaining)
+                        else:
+                            time.sleep(remaining)
+
+                # One bulk friendships probe per ~100 ids confirms the batch
+                # actually took instead of trusting each per-call response;
+                # anything still reported as followed moves to failed and has
+                # its journal entry revoked so a retry is not skipped.
+                still_following = self._verify_unfollows(removed)
+                if still_following:
+                    removed[:] = [name for name in removed if name not in still_following]
+                    for name in sorted(still_following):
+                        failed.append((name, "still following after unfollow"))
+                        self._journal_unfollow(journal_file, name, revoked=True)
+            finally:
+                self._unfollow_backoff_delay = current_delay
+                self._unfollow_backoff_at = time.monotonic()
+                if journal_file is not None:
+                    try:
+                        journal_file.close()
+                    except Exception:
+                        pass
 
-                if progress_callback:
-                    progress_callback(index, total, cleaned, success, error_message)
+        if removed or skipped:
+            self._invalidate_scan_cache()
+        # Failures are kept as (name, reason) pairs in the paced loop and only
+        # formatted here, outside the hot path.
+        return {
+            "removed": frozenset(removed),
+            "skipped": frozenset(skipped),
+            "failed": [f"{name}: {reason}" for name, reason in failed],
+        }
 
-                if index < total:
-                    time.sleep(max(delay_seconds, 0.2))
+    def _load_unfollow_journal(self) -> set[str]:
+        # Last entry per name wins, so a revoked entry (t=0) written after a
+        # failed verification cancels the earlier success record.
+        latest: dict[str, float] = {}
+        try:
+            with self.journal_path.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = _json_loads(line)
+                    except Exception:
+                        continue
+                    if (
+                        isinstance(entry, dict)
+                        and entry.get("u")
+                        and isinstance(entry.get("t"), (int, float))
+                    ):
+                        latest[entry["u"]] = entry["t"]
+        except OSError:
+            return set()
+        cutoff = time.time() - self.UNFOLLOW_JOURNAL_TTL_SECONDS
+        return {name for name, stamp in latest.items() if stamp >= cutoff}
+
+    @staticmethod
+    def _journal_unfollow(journal_file, username: str, revoked: bool = False) -> None:
+        if journal_file is None:
+            return
+        try:
+            payload = _json_dumps({"u": username, "t": 0 if revoked else int(time.time())})
+            if isinstance(payload, bytes):
+                payload = payload.decode("utf-8")
+            journal_file.write(payload + "\n")
+            journal_file.flush()
+        except Exception:
+            pass
 
-        return {"removed": removed, "skipped": skipped, "failed": failed}
+    def _verify_unfollows(self, removed: list[str]) -> set[str]:
+        # friendships/show_many takes up to ~100 comma-joined ids per POST, so
+        # reconciling a whole batch costs ceil(N/100) same-origin requests.
+        # Only names whose id was harvested during scans or prefetch can be
+        # checked; anything unverifiable keeps the per-call result.
+        if not removed or self.driver is None:
+            return set()
+        id_to_name: dict[str, str] = {}
+        for name in removed:
+            user_id = self._username_to_id.get(name.lower())
+            if user_id:
+                id_to_name[str(user_id)] = name
+        if not id_to_name:
+            return set()
+
+        still_following: set[str] = set()
+        ids = list(id_to_name)
+        for start in range(0, len(ids), 100):
+            chunk = ids[start : start + 100]
+            try:
+                statuses = self.driver.execute_async_script(
+                    """
+                    const ids = arguments[0];
+                    const done = arguments[arguments.length - 1];
+                    const csrf = (document.cookie.match(/(?:^|; )csrftoken=([^;]+)/) || [])[1];
+                    if (!csrf) { done(null); return; }
+                    fetch('/api/v1/friendships/show_many/', {
+                        method: 'POST',
+                        headers: {
+                            'content-type': 'application/x-www-form-urlencoded',
+                            'x-csrftoken': csrf,
+                            'x-ig-app-id': '936619743392459',
+                            'x-requested-with': 'XMLHttpRequest',
+                        },
+                        credentials: 'include',
+                        body: 'user_ids=' + ids.join(','),
+                    }).then(r => r.ok ? r.json() : Promise.reject(r.status))
+                      .then(data => done((data && data.friendship_statuses) || null))
+                      .catch(() => done(null));
+                    """,
+                    chunk,
+                )
+            except Exception:
+                return still_following
+            if not isinstance(statuses, dict):
+                continue
+            for user_id, status in statuses.items():
+                name = id_to_name.get(str(user_id))
+                if name and isinstance(status, dict) and status.get("following") is True:
+                    still_following.add(name)
+        return still_following
 
     def close_browser(self) -> None:
         with self.lock:
+            drivers = list(self._driver_pool.values())
+            self._driver_pool.clear()
             if self.driver is not None:
+                drivers.append(self.driver)
+                self.driver = None
+            for driver in drivers:
                 try:
-                    self.driver.quit()
+                    driver.quit()
                 except Exception:
                     pass
-                self.driver = None
 
     def _ensure_driver(self) -> None:
         if self.driver is not None:
@@ -255,10 +732,22 @@ class InstagramService:
             except Exception:
                 self.driver = None
 
+        # undetected_chromedriver is by far the heaviest import in this
+        # module; defer it so apps that import the service at startup only
+        # pay for it once the user actually logs in.
+        import undetected_chromedriver as uc
+
         options = uc.ChromeOptions()
+        # Return from driver.get at DOMContentLoaded instead of full load;
+        # every navigation already follows up with an explicit wait on the
+        # element it needs (//header, follow button, dialog).
+        options.page_load_strategy = "eager"
         options.add_argument("--start-maximized")
         options.add_argument("--disable-notifications")
         options.add_argument("--lang=en-US")
+        # Expose CDP network events so scans can read the friendships XHR
+        # bodies (see _drain_friendship_usernames).
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
         chrome_path = self._find_chrome_binary()
         if not chrome_path:
@@ -284,32 +773,62 @@ class InstagramService:
                 "Could not start Chrome automation. Make sure Google Chrome is installed and updated."
             ) from exc
 
+        self._widen_command_pool(self.driver)
+
+        # Many probes here intentionally accept empty find_elements results;
+        # pin the implicit wait to zero so every "no match" returns at once
+        # and timing stays solely with the explicit WebDriverWaits.
+        try:
+            self.driver.implicitly_wait(0)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _widen_command_pool(driver) -> None:
+        # Selenium's RemoteConnection defaults to a single pooled socket, so
+        # command bursts in the scroll loop queue at the HTTP layer and churn
+        # sockets. Best-effort: _conn is a private attribute.
+        try:
+            driver.command_executor._conn = urllib3.PoolManager(
+                maxsize=10,
+                block=False,
+                timeout=urllib3.Timeout(connect=10, read=60),
+            )
+        except Exception:
+            pass
+
     def _wait_for_login_success(self, timeout_seconds: int) -> None:
-        deadline = time.time() + timeout_seconds
-        while time.time() < deadline:
+        def logged_in(driver) -> bool:
             try:
-                current_url = self.driver.current_url.lower()
+                current_url = driver.current_url.lower()
             except Exception:
                 current_url = ""
 
-            session_cookie = self.driver.get_cookie("sessionid")
-            user_cookie = self.driver.get_cookie("ds_user_id")
-            logged_in = (
-                session_cookie
-                and session_cookie.get("value")
-                and user_cookie
-                and user_cookie.get("value")
+            # CDP Network.getCookies with a URL filter is one cheap RPC; the
+            # JSON-Wire get_cookies path stays as a fallback for drivers
+            # without CDP support.
+            try:
+                raw = driver.execute_cdp_cmd(
+                    "Network.getCookies", {"urls": ["https://www.instagram.com"]}
+                ).get("cookies", [])
+            except Exception:
+                try:
+                    raw = driver.get_cookies()
+                except Exception:
+                    return False
+            cookies = {c.get("name"): c.get("value") for c in raw}
+            return bool(
+                cookies.get("sessionid")
+                and cookies.get("ds_user_id")
                 and "/accounts/login" not in current_url
             )
 
-            if logged_in:
-                return
-
-            time.sleep(2)
-
-        raise InstagramServiceError(
-            "Browser login timeout. Complete login/challenge in Chrome, then retry."
-        )
+        try:
+            WebDriverWait(self.driver, timeout_seconds, poll_frequency=0.5).until(logged_in)
+        except TimeoutException as exc:
+            raise InstagramServiceError(
+                "Browser login timeout. Complete login/challenge in Chrome, then retry."
+            ) from exc
 
     def _fill_username_hint(self, username: str) -> None:
         try:
@@ -330,17 +849,23 @@ class InstagramService:
             "السماح بالضرورية فقط",
             "قبول الكل",
         }
+        # One script call scans and clicks inside the browser; fetching every
+        # button element and reading .text paid a round-trip per button.
         try:
-            buttons = self.driver.find_elements(By.XPATH, "//button")
-            for button in buttons:
-                text = self._normalize_text(button.text)
-                if text in labels:
-                    try:
-                        button.click()
-                        time.sleep(0.7)
-                    except Exception:
-                        pass
-                    return
+            clicked = self.driver.execute_script(
+                (
+                    "const labels = new Set(arguments[0]);"
+                    "for (const button of document.querySelectorAll('button')) {"
+                    "  const text = String(button.innerText || '')"
+                    "    .toLowerCase().replace(/\\s+/g, ' ').trim();"
+                    "  if (labels.has(text)) { button.click(); return true; }"
+                    "}"
+                    "return false;"
+                ),
+                sorted(labels),
+            )
+            if clicked:
+                time.sleep(0.7)
         except Exception:
             return
 
@@ -350,7 +875,7 @@ class InstagramService:
             username_input = WebDriverWait(self.driver, 20).until(
                 EC.presence_of_element_located((By.NAME, "username"))
             )
-            value = (username_input.get_attribute("value") or "").strip().lstrip("@")
+            value = _clean_username(username_input.get_attribute("value") or "")
             if value:
                 return value
         except TimeoutException:
@@ -358,9 +883,11 @@ class InstagramService:
 
         try:
             self.driver.get("https://www.instagram.com/")
-            links = self.driver.find_elements(By.XPATH, "//a[contains(@href,'instagram.com') or starts-with(@href,'/')]")
-            for link in links:
-                href = link.get_attribute("href") or ""
+            hrefs = self.driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href]'),"
+                " a => a.getAttribute('href'));"
+            ) or []
+            for href in hrefs:
                 candidate = self._username_from_href(href)
                 if candidate:
                     return candidate
@@ -383,16 +910,110 @@ class InstagramService:
         if not self.username:
             raise InstagramServiceError("Could not detect your Instagram username after login.")
 
-    def _collect_user_list(
+    def _collect_user_set(
         self,
         username: str,
         relation: str,
         progress_callback: ListScanCallback | None = None,
-    ) -> list[str]:
+    ) -> set[str]:
+        scan = self._relation_scan(username, relation, progress_callback=progress_callback)
+        while True:
+            try:
+                next(scan)
+            except StopIteration as stop:
+                return stop.value
+
+    def _collect_user_sets_parallel(
+        self,
+        progress_callback: ListScanCallback | None = None,
+    ) -> tuple[set[str], set[str]] | None:
+        # Scan following and followers at the same time in two tabs: while one
+        # tab's scroll round settles in-page, the other tab's list keeps
+        # fetching over the network. Returns None when a second tab cannot be
+        # opened so the caller falls back to the serial scan.
+        try:
+            primary = self.driver.current_window_handle
+            self.driver.switch_to.new_window("tab")
+            secondary = self.driver.current_window_handle
+            self.driver.switch_to.window(primary)
+        except Exception:
+            return None
+
+        scans: dict[str, tuple[str, Generator[None, None, set[str]]]] = {
+            primary: (
+                "following",
+                self._relation_scan(self.username, "following", progress_callback=progress_callback),
+            ),
+            secondary: (
+                "followers",
+                self._relation_scan(self.username, "followers", progress_callback=progress_callback),
+            ),
+        }
+        results: dict[str, set[str]] = {}
+        try:
+            while scans:
+                for handle in list(scans):
+                    relation, scan = scans[handle]
+                    self.driver.switch_to.window(handle)
+                    try:
+                        next(scan)
+                    except StopIteration as stop:
+                        results[relation] = stop.value
+                        del scans[handle]
+        finally:
+            try:
+                self.driver.switch_to.window(secondary)
+                self.driver.close()
+            except Exception:
+                pass
+            try:
+                self.driver.switch_to.window(primary)
+            except Exception:
+                pass
+        return results["following"], results["followers"]
+
+    def _relation_scan(
+        self,
+        username: str,
+        relation: str,
+        progress_callback: ListScanCallback | None = None,
+    ) -> Generator[None, None, set[str]]:
+        # One relation scan as a generator that yields control after every
+        # scroll round, so two scans can interleave across browser tabs. The
+        # caller must keep the scan's tab focused while advancing it.
         relation = relation.strip().lower()
         if relation not in {"following", "followers"}:
             raise InstagramServiceError(f"Unsupported relation: {relation}")
 
+        self._block_scan_resources(True)
+        try:
+            result = yield from self._relation_scan_rounds(
+                username, relation, progress_callback=progress_callback
+            )
+        finally:
+            self._block_scan_resources(False)
+        return result
+
+    def _block_scan_resources(self, enabled: bool) -> None:
+        # Applies to the currently focused tab only, which is exactly the tab
+        # the scan runs in (see _collect_user_sets_parallel).
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs",
+                {"urls": self.SCAN_BLOCKED_URL_PATTERNS if enabled else []},
+            )
+            if not enabled:
+                self.driver.execute_cdp_cmd("Network.disable", {})
+        except Exception:
+            pass
+
+    def _relation_scan_rounds(
+        self,
+        username: str,
+        relation: str,
+        progress_callback: ListScanCallback | None = None,
+    ) -> Generator[None, None, set[str]]:
         expected_total = self._open_relation_from_profile(username, relation)
         container = self._resolve_relation_container(relation)
 
@@ -402,20 +1023,34 @@ class InstagramService:
         max_rounds = 600
 
         scroll_box = self._find_scroll_box(container)
+        observing = self._install_href_observer(container)
+
+        settle_ms = 300
 
         for _ in range(max_rounds):
             previous_count = len(usernames)
-            usernames.update(self._extract_usernames(container))
+            step = self._scroll_step_async(scroll_box, settle_ms) if observing else None
+            if step is not None:
+                fresh_hrefs, moved = step
+                for href in fresh_hrefs:
+                    candidate = self._username_from_href(href)
+                    if candidate:
+                        usernames.add(candidate)
+                if not moved:
+                    scroll_box = self._find_scroll_box(container)
+            else:
+                observing = False
+                usernames.update(self._extract_usernames(container))
+                moved = self._scroll_relation_box(scroll_box)
+                if not moved:
+                    scroll_box = self._find_scroll_box(container)
+                    moved = self._scroll_relation_box(scroll_box)
+            usernames.update(self._drain_friendship_usernames(relation))
             current_count = len(usernames)
 
             if current_count > previous_count and progress_callback:
                 progress_callback(relation, current_count)
 
-            moved = self._scroll_relation_box(scroll_box)
-            if not moved:
-                scroll_box = self._find_scroll_box(container)
-                moved = self._scroll_relation_box(scroll_box)
-
             if current_count == previous_count:
                 stable_rounds += 1
             else:
@@ -429,8 +1064,18 @@ class InstagramService:
             if stable_rounds >= 14 and no_movement_rounds >= 6:
                 break
 
-            time.sleep(0.85 if stable_rounds < 4 else 1.1)
+            # Pace by arrival rate: poll fast while names are streaming in,
+            # back off once the list has gone quiet. In the async path the
+            # settle happens in-page, so no extra Python-side sleep is needed.
+            delta = current_count - previous_count
+            if step is not None:
+                settle_ms = 150 if delta >= 5 else 350 if delta >= 1 else 900
+            else:
+                time.sleep(0.15 if delta >= 5 else 0.35 if delta >= 1 else 0.9)
+
+            yield
 
+        self._teardown_href_observer()
         self._close_relation_view()
 
         if expected_total is not None and len(usernames) < expected_total:
@@ -446,12 +1091,58 @@ class InstagramService:
         if progress_callback:
             progress_callback(relation, len(usernames))
 
-        return sorted(usernames, key=str.lower)
+        return usernames
+
+    def _drain_friendship_usernames(self, relation: str) -> set[str]:
+        # Read usernames straight out of the paginated friendships XHRs via
+        # the CDP performance log, so entries the virtualized list never
+        # renders are still captured. get_log drains the whole session, so
+        # parsed names are buffered per relation (parallel scans share one
+        # log); the DOM/observer path stays authoritative and this is purely
+        # additive.
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return self._xhr_usernames.get(relation, set())
+
+        for entry in entries:
+            try:
+                message = _json_loads(entry["message"])["message"]
+                if message.get("method") != "Network.responseReceived":
+                    continue
+                params = message["params"]
+                match = _FRIENDSHIP_URL_RE.search(params["response"].get("url", ""))
+                if not match:
+                    continue
+                body = self.driver.execute_cdp_cmd(
+                    "Network.getResponseBody",
+                    {"requestId": params["requestId"]},
+                )
+                payload = _json_loads(body.get("body") or "")
+                bucket = self._xhr_usernames.setdefault(match.group(1), set())
+                for user in payload.get("users") or []:
+                    username = user.get("username")
+                    if username:
+                        bucket.add(username)
+                        user_id = user.get("pk") or user.get("pk_id") or user.get("id")
+                        if user_id:
+                            self._username_to_id[username.lower()] = str(user_id)
+            except Exception:
+                continue
+
+        return self._xhr_usernames.get(relation, set())
 
     def _open_relation_from_profile(self, username: str, relation: str) -> int | None:
-        self.driver.get(f"https://www.instagram.com/{username}/")
+        # Skip the page load when the profile is already open (e.g. the second
+        # relation scan right after the first one closed its popup).
+        try:
+            current_path = urlparse(self.driver.current_url or "").path.strip("/").lower()
+        except Exception:
+            current_path = ""
+        if current_path != _clean_username(username).lower():
+            self.driver.get(f"https://www.instagram.com/{username}/")
         try:
-            WebDriverWait(self.driver, 20).until(
+            WebDriverWait(self.driver, 20, poll_frequency=0.2).until(
                 EC.presence_of_element_located((By.XPATH, "//header"))
             )
         except TimeoutException as exc:
@@ -475,12 +1166,19 @@ class InstagramService:
                 raise InstagramServiceError(
                     f"Could not open {relation} list from profile @{username}."
                 ) from exc
-        time.sleep(0.8)
+        try:
+            # Return as soon as the popup exists rather than sleeping a fixed
+            # 0.8 s; _resolve_relation_container raises the user-facing error.
+            WebDriverWait(self.driver, 8, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.XPATH, "//div[@role='dialog']"))
+            )
+        except TimeoutException:
+            pass
         return expected_total
 
     def _resolve_relation_container(self, relation: str):
         try:
-            dialog = WebDriverWait(self.driver, 12).until(
+            dialog = WebDriverWait(self.driver, 12, poll_frequency=0.2).until(
                 EC.presence_of_element_located((By.XPATH, "//div[@role='dialog']"))
             )
             return dialog
@@ -490,7 +1188,7 @@ class InstagramService:
             )
 
     def _find_relation_link(self, username: str, relation: str):
-        username_norm = username.strip().lstrip("@").lower()
+        username_norm = _clean_username(username).lower()
         links = self.driver.find_elements(By.XPATH, "//header//a[contains(@href,'/followers/') or contains(@href,'/following/')]")
         for link in links:
             href = link.get_attribute("href") or ""
@@ -505,7 +1203,9 @@ class InstagramService:
     def _close_relation_view(self) -> None:
         try:
             self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-            time.sleep(0.3)
+            WebDriverWait(self.driver, 2, poll_frequency=0.1).until_not(
+                EC.presence_of_element_located((By.XPATH, "//div[@role='dialog']"))
+            )
         except Exception:
             pass
 
@@ -520,7 +1220,7 @@ class InstagramService:
         usernames = set(existing_usernames)
         try:
             self.driver.get(f"https://www.instagram.com/{username}/{relation}/")
-            page_container = WebDriverWait(self.driver, 15).until(
+            page_container = WebDriverWait(self.driver, 15, poll_frequency=0.2).until(
                 EC.presence_of_element_located((By.XPATH, "//main"))
             )
         except Exception:
@@ -544,15 +1244,33 @@ class InstagramService:
                 stable_rounds = 0
 
             try:
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                previous_height = self.driver.execute_script(
+                    "const height = document.body.scrollHeight;"
+                    "window.scrollTo(0, height);"
+                    "return height;"
+                )
                 self.driver.find_element(By.TAG_NAME, "body").send_keys(Keys.END)
             except Exception:
-                pass
+                previous_height = None
 
             if stable_rounds >= 24:
                 break
 
-            time.sleep(0.9 if stable_rounds < 6 else 1.2)
+            if previous_height is None:
+                time.sleep(0.9)
+            else:
+                # Poll briefly for the page to grow instead of a flat sleep;
+                # move on as soon as new rows have been appended.
+                for _ in range(10):
+                    time.sleep(0.1)
+                    try:
+                        height = self.driver.execute_script(
+                            "return document.body.scrollHeight;"
+                        )
+                    except Exception:
+                        break
+                    if height != previous_height:
+                        break
 
         return usernames
 
@@ -600,74 +1318,161 @@ class InstagramService:
         if not normalized:
             return None
 
-        relation_labels = [relation]
-        if relation == "following":
-            relation_labels.extend(["following", "يتابع", "المتابعة"])
-        else:
-            relation_labels.extend(["followers", "متابع", "المتابعين"])
-
-        number_pattern = r"([0-9][0-9,\.]*\s*[kmb]?)"
-        for label in relation_labels:
-            label_norm = self._normalize_text(label)
-            if not label_norm:
-                continue
-            match = re.search(number_pattern + r"\s*" + re.escape(label_norm), normalized)
-            if not match:
-                match = re.search(re.escape(label_norm) + r"\s*" + number_pattern, normalized)
+        for pattern in _RELATION_COUNT_PATTERNS.get(relation, []):
+            match = pattern.search(normalized)
             if match:
                 value = self._parse_compact_number(match.group(1))
                 if value is not None:
                     return value
 
-        for token in re.findall(number_pattern, normalized):
+        for token in _NUMBER_RE.findall(normalized):
             value = self._parse_compact_number(token)
             if value is not None:
                 return value
         return None
 
+    _COMPACT_MULTIPLIERS = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+
     def _parse_compact_number(self, raw_value: str) -> int | None:
-        token = (raw_value or "").strip().lower().replace(" ", "")
-        if not token:
+        # One pass over the text instead of chained replace/count scans:
+        # classify each char, record where dots fall, then decide whether a
+        # lone dot was a decimal point or a thousands separator.
+        digits: list[str] = []
+        dots: list[int] = []
+        suffix = ""
+        for ch in (raw_value or "").lower():
+            if "0" <= ch <= "9":
+                if suffix:
+                    return None
+                digits.append(ch)
+            elif ch == ".":
+                if suffix:
+                    return None
+                dots.append(len(digits))
+            elif ch in "kmb":
+                if suffix:
+                    return None
+                suffix = ch
+            elif ch == "," or ch.isspace():
+                continue
+            else:
+                return None
+        if not digits:
             return None
 
-        suffix = ""
-        if token[-1] in {"k", "m", "b"}:
-            suffix = token[-1]
-            token = token[:-1]
+        number = "".join(digits)
+        value = float(number)
+        if len(dots) == 1:
+            # A lone dot with exactly three trailing digits and no suffix is a
+            # thousands separator ("1.234"); anything else is a decimal point.
+            if suffix or len(digits) - dots[0] != 3:
+                value = float(number[: dots[0]] + "." + number[dots[0]:])
+        return int(value * self._COMPACT_MULTIPLIERS[suffix])
 
-        token = token.replace(",", "")
-        if token.count(".") > 1:
-            token = token.replace(".", "")
-        elif not suffix and token.count(".") == 1 and len(token.split(".")[-1]) == 3:
-            token = token.replace(".", "")
+    def _normalize_digits(self, value: str) -> str:
+        return value.translate(_DIGIT_TRANS)
 
+    def _install_href_observer(self, container) -> bool:
+        # Seed a page-side seen-set and watch the list for added anchors, so
+        # each scroll round only transfers hrefs we have not seen yet instead
+        # of re-scanning the whole (virtualized) list from Python.
         try:
-            value = float(token)
-        except ValueError:
-            return None
+            self.driver.execute_script(
+                """
+                const root = arguments[0];
+                window.__igSeen = new Set();
+                window.__igNew = [];
+                const collect = (node) => {
+                    if (!node || node.nodeType !== 1) return;
+                    const anchors = node.matches && node.matches('a[href]')
+                        ? [node]
+                        : Array.from(node.querySelectorAll('a[href]'));
+                    for (const a of anchors) {
+                        const href = a.getAttribute('href');
+                        if (href && !window.__igSeen.has(href)) {
+                            window.__igSeen.add(href);
+                            window.__igNew.push(href);
+                        }
+                    }
+                };
+                collect(root);
+                if (window.__igObserver) window.__igObserver.disconnect();
+                window.__igObserver = new MutationObserver((mutations) => {
+                    for (const m of mutations) {
+                        for (const n of m.addedNodes) collect(n);
+                    }
+                });
+                window.__igObserver.observe(root, {childList: true, subtree: true});
+                """,
+                container,
+            )
+            return True
+        except Exception:
+            return False
 
-        multipliers = {"": 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
-        return int(value * multipliers.get(suffix, 1))
+    def _scroll_step_async(self, scroll_box, settle_ms: int) -> tuple[list[str], bool] | None:
+        # One scroll round in a single WebDriver hop: bump scrollTop, let the
+        # page settle, then hand back the observer's fresh hrefs plus whether
+        # the box actually moved. Replaces the separate scroll, metric-read
+        # and drain calls (and the Python-side sleep between them).
+        try:
+            result = self.driver.execute_async_script(
+                """
+                const box = arguments[0];
+                const settle = arguments[1];
+                const done = arguments[arguments.length - 1];
+                const before = box.scrollTop;
+                box.scrollTop = before + box.clientHeight * 0.9;
+                setTimeout(() => {
+                    const fresh = window.__igNew || [];
+                    window.__igNew = [];
+                    done([fresh, box.scrollTop > before + 1]);
+                }, settle);
+                """,
+                scroll_box,
+                settle_ms,
+            )
+        except Exception:
+            return None
+        if not result or len(result) != 2:
+            return None
+        return list(result[0] or []), bool(result[1])
 
-    def _normalize_digits(self, value: str) -> str:
-        mapping = str.maketrans(
-            "٠١٢٣٤٥٦٧٨٩۰۱۲۳۴۵۶۷۸۹٬٫",
-            "01234567890123456789,.",
-        )
-        return value.translate(mapping)
+    def _teardown_href_observer(self) -> None:
+        try:
+            self.driver.execute_script(
+                "if (window.__igObserver) window.__igObserver.disconnect();"
+                " window.__igObserver = window.__igSeen = window.__igNew = undefined;"
+            )
+        except Exception:
+            pass
 
     def _extract_usernames(self, dialog) -> set[str]:
+        # One execute_script hop returns every href at once; the old
+        # find_elements + get_attribute pattern paid a WebDriver round-trip
+        # per anchor, which dominated scan time on large lists.
+        try:
+            hrefs = self.driver.execute_script(
+                "return Array.from(arguments[0].querySelectorAll('a[href]'),"
+                " a => a.getAttribute('href'));",
+                dialog,
+            ) or []
+        except Exception:
+            hrefs = self._extract_hrefs_fallback(dialog)
+
         usernames: set[str] = set()
+        for href in hrefs:
+            candidate = self._username_from_href(href)
+            if candidate:
+                usernames.add(candidate)
+        return usernames
+
+    def _extract_hrefs_fallback(self, dialog) -> list[str]:
         try:
             links = dialog.find_elements(By.XPATH, ".//a[contains(@href, '/')]")
-            for link in links:
-                href = link.get_attribute("href") or ""
-                candidate = self._username_from_href(href)
-                if candidate:
-                    usernames.add(candidate)
+            return [link.get_attribute("href") or "" for link in links]
         except Exception:
-            pass
-        return usernames
+            return []
 
     def _find_scroll_box(self, dialog):
         js_candidate = None
@@ -746,50 +1551,35 @@ class InstagramService:
 
     def _scroll_relation_box(self, element) -> bool:
         before = self._get_scroll_metrics(element)
-        moved = False
 
         if element is not None:
+            # Metrics-before, focus, scroll step, wheel fallback and the
+            # moved check all run in one script hop; they used to cost 4-6
+            # separate WebDriver round-trips per attempted scroll.
             try:
-                self.driver.execute_script(
-                    (
-                        "const el = arguments[0];"
-                        "if (el && typeof el.focus === 'function') { el.focus(); }"
-                    ),
-                    element,
-                )
-            except Exception:
-                pass
-
-            try:
-                self.driver.execute_script(
-                    (
-                        "const el = arguments[0];"
-                        "if (!el) return;"
-                        "const step = Math.max((el.clientHeight || 0) * 0.92, 360);"
-                        "el.scrollTop = Math.min((el.scrollTop || 0) + step, el.scrollHeight || 0);"
-                    ),
-                    element,
-                )
-            except Exception:
-                pass
-
-            moved = self._did_scroll_change(before, self._get_scroll_metrics(element))
-            if moved:
-                return True
-
-            try:
-                self.driver.execute_script(
-                    (
-                        "const el = arguments[0];"
-                        "if (!el) return;"
-                        "const ev = new WheelEvent('wheel', {deltaY: 700, bubbles: true, cancelable: true});"
-                        "el.dispatchEvent(ev);"
-                    ),
-                    element,
+                moved = bool(
+                    self.driver.execute_script(
+                        (
+                            "const el = arguments[0];"
+                            "if (!el) return false;"
+                            "const top = el.scrollTop || 0;"
+                            "const height = el.scrollHeight || 0;"
+                            "if (typeof el.focus === 'function') { el.focus(); }"
+                            "const step = Math.max((el.clientHeight || 0) * 0.92, 360);"
+                            "el.scrollTop = Math.min(top + step, height);"
+                            "const changed = () => el.scrollTop > top + 1"
+                            " || (el.scrollHeight || 0) > height + 4;"
+                            "if (!changed()) {"
+                            "  el.dispatchEvent(new WheelEvent('wheel',"
+                            "    {deltaY: 700, bubbles: true, cancelable: true}));"
+                            "}"
+                            "return changed();"
+                        ),
+                        element,
+                    )
                 )
             except Exception:
-                pass
-            moved = self._did_scroll_change(before, self._get_scroll_metrics(element))
+                moved = False
             if moved:
                 return True
 
@@ -834,34 +1624,146 @@ class InstagramService:
         return False
 
     def _username_from_href(self, href: str) -> str | None:
-        if not href:
-            return None
+        return _href_username(href)
 
-        parsed = urlparse(href)
-        path = parsed.path if parsed.path else href
-        if not path:
-            return None
+    def _unfollow_single(self, username: str) -> tuple[bool, str, bool]:
+        api_result = self._unfollow_via_api(username)
+        if api_result is not None:
+            return api_result
+        return self._unfollow_via_profile(username)
+
+    def _prefetch_user_ids(self, usernames: list[str]) -> None:
+        # The id lookups are read-only and independent, so run them through a
+        # small in-page fetch pool (6 concurrent) before the serial unfollow
+        # stage; batches of 25 keep each async script well under the driver's
+        # script timeout. Failures just leave the per-target fallback in place.
+        missing = [name for name in usernames if name and name.lower() not in self._username_to_id]
+        if not missing:
+            return
 
-        clean = path.strip("/")
-        if not clean:
-            return None
-        first = clean.split("/")[0]
-        if not first:
-            return None
+        try:
+            host = urlparse(self.driver.current_url or "").netloc
+        except Exception:
+            host = ""
+        if "instagram.com" not in host:
+            try:
+                self.driver.get("https://www.instagram.com/")
+            except Exception:
+                return
 
-        normalized = first.lower()
-        if normalized in self.RESERVED_PATHS:
-            return None
+        for start in range(0, len(missing), 25):
+            batch = missing[start : start + 25]
+            try:
+                resolved = self.driver.execute_async_script(
+                    """
+                    const usernames = arguments[0];
+                    const limit = arguments[1];
+                    const done = arguments[arguments.length - 1];
+                    const results = {};
+                    let index = 0;
+                    let active = 0;
+                    const pump = () => {
+                        if (index >= usernames.length && active === 0) {
+                            done(results);
+                            return;
+                        }
+                        while (active < limit && index < usernames.length) {
+                            const name = usernames[index++];
+                            active++;
+                            fetch('/api/v1/users/web_profile_info/?username='
+                                    + encodeURIComponent(name), {
+                                headers: {'x-ig-app-id': '936619743392459'},
+                                credentials: 'include',
+                            }).then(r => r.ok ? r.json() : null)
+                              .then(data => {
+                                  const user = data && data.data && data.data.user;
+                                  if (user && user.id) results[name] = String(user.id);
+                              })
+                              .catch(() => {})
+                              .then(() => { active--; pump(); });
+                        }
+                    };
+                    pump();
+                    """,
+                    batch,
+                    6,
+                )
+            except Exception:
+                return
+            if isinstance(resolved, dict):
+                for name, user_id in resolved.items():
+                    if name and user_id:
+                        self._username_to_id[name.lower()] = str(user_id)
+
+    def _unfollow_via_api(self, username: str) -> tuple[bool, str, bool] | None:
+        # Unfollow through the web friendships endpoint with the session's own
+        # cookies: one same-origin POST instead of a profile load plus several
+        # DOM polls. Returns None on any failure so the DOM path — which can
+        # also verify state and spot action-blocked banners — takes over.
+        try:
+            host = urlparse(self.driver.current_url or "").netloc
+        except Exception:
+            host = ""
+        if "instagram.com" not in host:
+            try:
+                self.driver.get("https://www.instagram.com/")
+            except Exception:
+                return None
 
-        if not re.match(r"^[A-Za-z0-9._]+$", first):
+        try:
+            result = self.driver.execute_async_script(
+                """
+                const username = arguments[0];
+                const knownId = arguments[1];
+                const done = arguments[arguments.length - 1];
+                const csrf = (document.cookie.match(/(?:^|; )csrftoken=([^;]+)/) || [])[1];
+                if (!csrf) { done({status: 'no-csrf'}); return; }
+                const getUser = knownId
+                    ? Promise.resolve({id: knownId})
+                    : fetch('/api/v1/users/web_profile_info/?username='
+                            + encodeURIComponent(username), {
+                        headers: {'x-ig-app-id': '936619743392459'},
+                        credentials: 'include',
+                    }).then(r => r.ok ? r.json() : Promise.reject('profile-' + r.status))
+                      .then(data => {
+                          const user = data && data.data && data.data.user;
+                          if (!user || !user.id) return Promise.reject('no-id');
+                          return user;
+                      });
+                getUser.then(user => {
+                      if (user.friendship_status
+                              && user.friendship_status.following === false) {
+                          return 'not-following';
+                      }
+                      return fetch('/web/friendships/' + user.id + '/unfollow/', {
+                          method: 'POST',
+                          headers: {
+                              'x-csrftoken': csrf,
+                              'x-requested-with': 'XMLHttpRequest',
+                          },
+                          credentials: 'include',
+                      }).then(r => r.ok ? 'ok' : Promise.reject('unfollow-' + r.status));
+                  })
+                  .then(status => done({status: status}))
+                  .catch(err => done({status: 'error', detail: String(err)}));
+                """,
+                username,
+                self._username_to_id.get(username.lower()),
+            )
+        except Exception:
             return None
 
-        return first
+        status = (result or {}).get("status")
+        if status == "ok":
+            return True, "", True
+        if status == "not-following":
+            return True, "Already not following.", False
+        return None
 
-    def _unfollow_single(self, username: str) -> tuple[bool, str, bool]:
+    def _unfollow_via_profile(self, username: str) -> tuple[bool, str, bool]:
         self.driver.get(f"https://www.instagram.com/{username}/")
         try:
-            WebDriverWait(self.driver, 8).until(
+            WebDriverWait(self.driver, 8, poll_frequency=0.2).until(
                 EC.presence_of_element_located((By.XPATH, "//header"))
             )
         except TimeoutException:
@@ -897,30 +1799,189 @@ class InstagramService:
             return True, "", True
         return False, verify_message, False
 
-    def _get_follow_state(self) -> tuple[str, str]:
-        button = self._find_follow_button()
-        if button is None:
-            return "unknown", ""
+    def _scan_follow_buttons(self) -> list[tuple[object, str]]:
+        # One script hop returns every header button together with its label;
+        # the element-by-element flow paid a WebDriver round-trip per button
+        # for .text / .get_attribute. Falls back to the XPath probe if the
+        # script hop fails.
+        try:
+            results = self.driver.execute_script(
+                "return Array.from("
+                " document.querySelectorAll(\"header button, header [role='button']\"),"
+                " node => [node, node.innerText || node.getAttribute('aria-label') || '']);"
+            ) or []
+        except Exception:
+            results = None
+        if results is None:
+            results = []
+            try:
+                elements = self.driver.find_elements(By.XPATH, self._FOLLOW_BUTTON_XPATH)
+            except Exception:
+                return []
+            for element in elements:
+                try:
+                    results.append(
+                        [element, element.text or element.get_attribute("aria-label") or ""]
+                    )
+                except Exception:
+                    continue
+        return [(node, self._normalize_text(label or "")) for node, label in results]
 
-        label = self._normalize_text(button.text or button.get_attribute("aria-label") or "")
-        if self._is_following_label(label):
-            return "following", label
-        if self._is_follow_label(label):
-            return "not_following", label
-        return "unknown", label
+    def _get_follow_state(self) -> tuple[str, str]:
+        for _, label in self._scan_follow_buttons():
+            if self._is_following_label(label):
+                return "following", label
+            if self._is_follow_label(label):
+                return "not_following", label
+        return "unknown", ""
 
     def _wait_for_follow_button(self, timeout_seconds: int = 5):
-        deadline = time.time() + max(timeout_seconds, 1)
-        while time.time() < deadline:
-            button = self._find_follow_button()
-            if button is not None:
-                return button
-            time.sleep(0.25)
-        return None
+        try:
+            return WebDriverWait(
+                self.driver, max(timeout_seconds, 1), poll_frequency=0.1
+            ).until(lambda driver: self._find_follow_button())
+        except TimeoutException:
+            return None
+
+    def _install_mutation_counter(self) -> bool:
+        # Cheap DOM-change token: one counter bumped by a MutationObserver so
+        # polls can skip full re-scans while nothing on the page has changed.
+        try:
+            self.driver.execute_script(
+                "if (!window.__igMuto) {"
+                "  window.__igMuto = 1;"
+                "  new MutationObserver(() => { window.__igMuto++; })"
+                "    .observe(document.body,"
+                "             {subtree: true, childList: true, attributes: true});"
+                "}"
+            )
+            return True
+        except Exception:
+            return False
+
+    def _unfollow_step_fused(self) -> dict | None:
+        # Blocked-banner scan, follow-state read and (if still needed) the
+        # confirmation click, all in one script hop instead of three separate
+        # element scans per poll.
+        try:
+            return self.driver.execute_script(
+                """
+                const followKeys = arguments[0];
+                const followingKeys = arguments[1];
+                const unfollowKeys = arguments[2];
+                const blockedKeys = arguments[3];
+                const norm = t => String(t || '')
+                    .toLowerCase().replace(/\\s+/g, ' ').trim();
+                // Same semantics as _compile_keyword_matcher: ASCII keywords
+                // match with word boundaries so 'unfollow' is not read as
+                // 'follow'; non-ASCII keywords stay substring checks.
+                const esc = s => s.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+                const matcher = keys => {
+                    const exact = new Set(keys);
+                    const ascii = keys.filter(k => /^[\\x00-\\x7f]+$/.test(k));
+                    const others = keys.filter(k => !/^[\\x00-\\x7f]+$/.test(k));
+                    const pattern = ascii.length
+                        ? new RegExp(ascii
+                            .sort((a, b) => b.length - a.length)
+                            .map(k => '(?<![a-z0-9_])' + esc(k) + '(?![a-z0-9_])')
+                            .join('|'))
+                        : null;
+                    return t => exact.has(t)
+                        || (pattern !== null && pattern.test(t))
+                        || others.some(k => t.includes(k));
+                };
+                const isFollowing = matcher(followingKeys);
+                const isFollow = matcher(followKeys);
+
+                let blocked = false;
+                for (const el of document.querySelectorAll(
+                        "div[role='alert'], div[role='dialog'], section, body")) {
+                    const text = norm(el.innerText);
+                    if (text && blockedKeys.some(k => text.includes(k))) {
+                        blocked = true;
+                        break;
+                    }
+                }
+
+                let state = 'unknown';
+                for (const el of document.querySelectorAll(
+                        "header button, header [role='button']")) {
+                    const text = norm(el.innerText || el.getAttribute('aria-label'));
+                    if (!text) continue;
+                    if (isFollowing(text)) {
+                        state = 'following';
+                        break;
+                    }
+                    if (isFollow(text)) {
+                        state = 'not_following';
+                        break;
+                    }
+                }
+
+                let confirmClicked = false;
+                if (!blocked && state !== 'not_following') {
+                    const roots = document.querySelectorAll(
+                        "div[role='dialog'], div[role='menu'], body");
+                    outer:
+                    for (const root of roots) {
+                        const nodes = root.querySelectorAll(
+                            "button, [role='button'], [role='menuitem'],"
+                            + " [role='option'], div[tabindex]");
+                        for (const node of nodes) {
+                            const style = window.getComputedStyle(node);
+                            if (style.display === 'none'
+                                    || style.visibility === 'hidden') continue;
+                            const text = norm(node.innerText || node.textContent
+                                || node.getAttribute('aria-label')
+                                || node.getAttribute('title'));
+                            if (!text) continue;
+                            if (unfollowKeys.some(k => text.includes(k))) {
+                                node.click();
+                                confirmClicked = true;
+                                break outer;
+                            }
+                        }
+                    }
+                }
+
+                return {state: state, blocked: blocked, confirmClicked: confirmClicked};
+                """,
+                list(self._FOLLOW_LABELS),
+                list(self._FOLLOWING_LABELS),
+                list(self._UNFOLLOW_LABELS),
+                list(self._BLOCKED_LABELS),
+            )
+        except Exception:
+            return None
 
     def _wait_for_unfollow_state(self, timeout_seconds: int = 8) -> tuple[bool, str]:
-        deadline = time.time() + max(timeout_seconds, 2)
-        while time.time() < deadline:
+        observing = self._install_mutation_counter()
+        last_token = None
+
+        def resolved(driver) -> tuple[bool, str] | None:
+            nonlocal last_token, observing
+            if observing:
+                try:
+                    token = self.driver.execute_script("return window.__igMuto || null;")
+                except Exception:
+                    token = None
+                if token is None:
+                    observing = False
+                elif token == last_token:
+                    # DOM unchanged since the last poll; one script hop
+                    # replaces the blocked/button/confirmation scans.
+                    return None
+                else:
+                    last_token = token
+
+            fused = self._unfollow_step_fused()
+            if fused is not None:
+                if fused.get("blocked"):
+                    return False, "Instagram blocked this unfollow action (try again later)."
+                if fused.get("state") == "not_following":
+                    return True, ""
+                return None
+
             blocked_message = self._detect_action_blocked_message()
             if blocked_message:
                 return False, blocked_message
@@ -931,94 +1992,44 @@ class InstagramService:
 
             # In some layouts, the confirm button appears late.
             self._click_unfollow_confirmation()
-            time.sleep(0.35)
+            return None
+
+        try:
+            return WebDriverWait(
+                self.driver, max(timeout_seconds, 2), poll_frequency=0.1
+            ).until(resolved)
+        except TimeoutException:
+            return False, "Unfollow was not confirmed. Instagram may have blocked the action."
+
+    # Union XPaths issue one find_elements round-trip per scan instead of one
+    # per selector; results come back in document order.
+    _BLOCKED_CONTAINERS_XPATH = "//div[@role='alert'] | //div[@role='dialog'] | //section | //body"
 
-        return False, "Unfollow was not confirmed. Instagram may have blocked the action."
+    _FOLLOW_BUTTON_XPATH = "//header//button | //header//div[@role='button']"
 
     def _detect_action_blocked_message(self) -> str | None:
-        keywords = self._normalized_keywords(self.ACTION_BLOCKED_KEYWORDS)
-        xpaths = [
-            "//div[@role='alert']",
-            "//div[@role='dialog']",
-            "//section",
-            "//body",
-        ]
-        for xpath in xpaths:
-            try:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-            except Exception:
+        try:
+            elements = self.driver.find_elements(By.XPATH, self._BLOCKED_CONTAINERS_XPATH)
+        except Exception:
+            return None
+        for element in elements[:12]:
+            text = self._normalize_text(element.text or "")
+            if not text:
                 continue
-            for element in elements[:3]:
-                text = self._normalize_text(element.text or "")
-                if not text:
-                    continue
-                if any(keyword in text for keyword in keywords):
-                    return "Instagram blocked this unfollow action (try again later)."
+            if _match_keywords(text, self._BLOCKED_MATCHER):
+                return "Instagram blocked this unfollow action (try again later)."
         return None
 
     def _find_follow_button(self):
-        selectors = [
-            "//header//button",
-            "//header//div[@role='button']",
-        ]
-
-        for selector in selectors:
-            try:
-                elements = self.driver.find_elements(By.XPATH, selector)
-            except Exception:
-                continue
-
-            for element in elements:
-                text = self._normalize_text(element.text or element.get_attribute("aria-label") or "")
-                if self._is_follow_label(text) or self._is_following_label(text):
-                    return element
-
+        for node, text in self._scan_follow_buttons():
+            if self._is_follow_label(text) or self._is_following_label(text):
+                return node
         return None
 
     def _click_unfollow_confirmation(self) -> bool:
-        keywords = self._normalized_keywords(self.UNFOLLOW_KEYWORDS)
-        xpaths = [
-            "//div[@role='dialog']//*[self::button or @role='button' or @role='menuitem' or @role='option' or @tabindex='0']",
-            "//div[@role='dialog']//button | //button",
-            "//*[@role='menuitem' or @role='option' or @role='button']",
-        ]
-
-        for xpath in xpaths:
-            try:
-                elements = self.driver.find_elements(By.XPATH, xpath)
-            except Exception:
-                continue
-
-            for element in elements:
-                try:
-                    if not element.is_displayed():
-                        continue
-                except Exception:
-                    continue
-
-                text = self._normalize_text(
-                    (
-                        element.text
-                        or element.get_attribute("aria-label")
-                        or element.get_attribute("title")
-                        or ""
-                    )
-                )
-                if not text:
-                    continue
-
-                if any(self._keyword_in_text(text, keyword) for keyword in keywords):
-                    try:
-                        self.driver.execute_script("arguments[0].click();", element)
-                    except Exception:
-                        try:
-                            element.click()
-                        except Exception:
-                            continue
-                    time.sleep(0.35)
-                    return True
-
-        # JS fallback for Instagram menu layouts where "Unfollow" is nested text.
+        # Visibility filtering and label matching both run in-page: one script
+        # hop instead of an is_displayed round-trip per dialog node plus
+        # per-element text/attribute reads.
         try:
             clicked = self.driver.execute_script(
                 (
@@ -1042,7 +2053,7 @@ class InstagramService:
                     "}"
                     "return false;"
                 ),
-                keywords,
+                list(self._UNFOLLOW_LABELS),
             )
             if clicked:
                 time.sleep(0.35)
@@ -1056,62 +2067,32 @@ class InstagramService:
         value = self._normalize_text(text)
         if not value:
             return False
-        follow_match = any(
-            self._keyword_in_text(value, keyword)
-            for keyword in self._normalized_keywords(self.FOLLOW_KEYWORDS)
-        )
-        following_match = any(
-            self._keyword_in_text(value, keyword)
-            for keyword in self._normalized_keywords(self.FOLLOWING_KEYWORDS)
+        return _match_keywords(value, self._FOLLOW_MATCHER) and not _match_keywords(
+            value, self._FOLLOWING_MATCHER
         )
-        return follow_match and not following_match
 
     def _is_following_label(self, text: str) -> bool:
         value = self._normalize_text(text)
         if not value:
             return False
-        return any(
-            self._keyword_in_text(value, keyword)
-            for keyword in self._normalized_keywords(self.FOLLOWING_KEYWORDS)
-        )
-
-    def _normalized_keywords(self, keywords: set[str]) -> list[str]:
-        return [self._normalize_text(keyword) for keyword in keywords]
-
-    def _keyword_in_text(self, text: str, keyword: str) -> bool:
-        if not text or not keyword:
-            return False
-        if keyword.isascii():
-            pattern = rf"(?<![a-z0-9_]){re.escape(keyword)}(?![a-z0-9_])"
-            return re.search(pattern, text) is not None
-        return keyword in text
+        return _match_keywords(value, self._FOLLOWING_MATCHER)
 
     def _normalize_text(self, value: str) -> str:
-        return " ".join(value.strip().lower().split())
+        return _normalize_label(value)
 
     def _find_chrome_binary(self) -> str | None:
-        for env_name in ("CHROME_PATH", "CHROME_BIN"):
-            env_path = os.environ.get(env_name, "").strip().strip('"')
-            if env_path and Path(env_path).exists():
-                return str(Path(env_path))
-
-        registry_path = self._find_chrome_from_registry()
-        if registry_path:
-            return registry_path
-
-        candidates = [
-            Path(os.environ.get("PROGRAMFILES", "")) / "Google/Chrome/Application/chrome.exe",
-            Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Google/Chrome/Application/chrome.exe",
-            Path(os.environ.get("LOCALAPPDATA", "")) / "Google/Chrome/Application/chrome.exe",
-            Path(os.environ.get("PROGRAMFILES", "")) / "Google/Chrome Beta/Application/chrome.exe",
-            Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Google/Chrome Beta/Application/chrome.exe",
-            Path(os.environ.get("PROGRAMFILES", "")) / "Google/Chrome Dev/Application/chrome.exe",
-            Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Google/Chrome Dev/Application/chrome.exe",
-            Path(os.environ.get("PROGRAMFILES", "")) / "Google/Chrome SxS/Application/chrome.exe",
-            Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Google/Chrome SxS/Application/chrome.exe",
-        ]
-
-        for path in candidates:
+        # Chrome's install path does not move during the process lifetime, so
+        # the path/registry probing below only ever needs to run once.
+        if self._chrome_path_checked:
+            return self._chrome_path
+        self._chrome_path = self._locate_chrome_binary()
+        self._chrome_path_checked = True
+        return self._chrome_path
+
+    def _locate_chrome_binary(self) -> str | None:
+        # Candidates are generated lazily, so when the env var or registry
+        # resolves, none of the install-dir Path objects are ever built.
+        for path in self._chrome_path_candidates():
             if str(path) and path.exists():
                 return str(path)
 
@@ -1122,8 +2103,27 @@ class InstagramService:
 
         return None
 
+    def _chrome_path_candidates(self):
+        for env_name in ("CHROME_PATH", "CHROME_BIN"):
+            env_path = os.environ.get(env_name, "").strip().strip('"')
+            if env_path:
+                yield Path(env_path)
+
+        registry_path = self._find_chrome_from_registry()
+        if registry_path:
+            yield Path(registry_path)
+
+        yield Path(os.environ.get("PROGRAMFILES", "")) / "Google/Chrome/Application/chrome.exe"
+        yield Path(os.environ.get("PROGRAMFILES(X86)", "")) / "Google/Chrome/Application/chrome.exe"
+        yield Path(os.environ.get("LOCALAPPDATA", "")) / "Google/Chrome/Application/chrome.exe"
+        for variant in ("Chrome Beta", "Chrome Dev", "Chrome SxS"):
+            yield Path(os.environ.get("PROGRAMFILES", "")) / f"Google/{variant}/Application/chrome.exe"
+            yield Path(os.environ.get("PROGRAMFILES(X86)", "")) / f"Google/{variant}/Application/chrome.exe"
+
     def _find_chrome_from_registry(self) -> str | None:
-        if winreg is None:
+        try:
+            import winreg
+        except ImportError:  # pragma: no cover
             return None
 
         keys = [